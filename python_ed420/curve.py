@@ -3,30 +3,94 @@
 
 import math
 
+try:
+    import gmpy2
+except ImportError:
+    gmpy2 = None
+
 # Field prime
 P = (1 << 420) - 335
 
+# Bignum backend: GMP through gmpy2 when installed, CPython ints otherwise.
+# Values handed out through the public API are always plain ints.
+if gmpy2 is not None:
+    _mpz = gmpy2.mpz
+    _powmod = gmpy2.powmod
+    _invert = gmpy2.invert
+else:
+    _mpz = int
+    _powmod = pow
+
+    def _invert(value, modulus):
+        # Same error as gmpy2.invert for a zero input
+        if value % modulus == 0:
+            raise ZeroDivisionError("Zero has no multiplicative inverse.")
+        return pow(value, -1, modulus)
+
+_P = _mpz(P)
+
+# Fixed exponent for the Euler criterion
+_P_MINUS_1_OVER_2 = _mpz((P - 1) // 2)
+
+def _tonelli_shanks_constants():
+    # P - 1 = 2^s * q with q odd; c = z^q for the smallest non-residue z
+    q, s = P - 1, 0
+    while q % 2 == 0:
+        q //= 2
+        s += 1
+    z = 2
+    while pow(z, (P - 1) // 2, P) == 1:
+        z += 1
+    return s, _mpz((q - 1) // 2), _mpz(pow(z, q, P))
+
+# P = 1 (mod 8), so square roots need Tonelli-Shanks (here s = 4)
+_TS_S, _TS_Q_MINUS_1_OVER_2, _TS_C = _tonelli_shanks_constants()
+
+_MASK_420 = (1 << 420) - 1
+
+def _reduce(x):
+    # P = 2^420 - 335, so x = lo + 2^420 * hi = lo + 335 * hi (mod P).
+    # Valid for 0 <= x < 2^840, i.e. any product of two reduced elements.
+    x = (x & _MASK_420) + 335 * (x >> 420)
+    x = (x & _MASK_420) + 335 * (x >> 420)
+    return x - P if x >= P else x
+
 class FieldElement:
+    __slots__ = ('value',)
+
     def __init__(self, value):
         if not isinstance(value, int):
             raise TypeError("FieldElement value must be an integer.")
         self.value = value % P
 
+    @classmethod
+    def _from_raw(cls, value):
+        # value must already lie in [0, P)
+        element = cls.__new__(cls)
+        element.value = value
+        return element
+
     def __add__(self, other):
         if isinstance(other, FieldElement):
-            return FieldElement(self.value + other.value)
+            value = self.value + other.value
+            return FieldElement._from_raw(value - P if value >= P else value)
         return FieldElement(self.value + other)
 
     def __sub__(self, other):
         if isinstance(other, FieldElement):
-            return FieldElement(self.value - other.value)
+            value = self.value - other.value
+            return FieldElement._from_raw(value + P if value < 0 else value)
         return FieldElement(self.value - other)
 
     def __mul__(self, other):
         if isinstance(other, FieldElement):
-            return FieldElement(self.value * other.value)
+            return FieldElement._from_raw(_reduce(self.value * other.value))
         return FieldElement(self.value * other)
 
+    def square(self):
+        # Convenience for self * self; it is not faster than __mul__
+        return FieldElement._from_raw(_reduce(self.value * self.value))
+
     def __truediv__(self, other):
         if isinstance(other, FieldElement):
             return self * other.inverse()
@@ -35,7 +99,7 @@ class FieldElement:
     def __pow__(self, power):
         if not isinstance(power, int) or power < 0:
             raise ValueError("Power must be a non-negative integer.")
-        return FieldElement(pow(self.value, power, P))
+        return FieldElement(int(_powmod(self.value, power, _P)))
 
     def __eq__(self, other):
         if isinstance(other, FieldElement):
@@ -52,27 +116,78 @@ class FieldElement:
         return str(self.value)
 
     def inverse(self):
-        return self.__pow__(P - 2) # Fermat's Little Theorem
+        if self.value == 0:
+            raise ZeroDivisionError("Zero has no multiplicative inverse.")
+        return FieldElement(int(_invert(self.value, _P)))
 
     def is_square(self):
         if self.value == 0:
             return True
-        return self.__pow__((P - 1) // 2) == 1
+        return _powmod(self.value, _P_MINUS_1_OVER_2, _P) == 1
 
     def sqrt(self):
-        if not self.is_square():
-            raise ValueError("Value is not a quadratic residue.")
-        # Tonelli-Shanks algorithm (simplified for P % 4 == 3)
-        # For P % 4 == 3, sqrt(n) = n^((P+1)/4) mod P
-        if P % 4 == 3:
-            return self.__pow__((P + 1) // 4)
-        # More general Tonelli-Shanks would be needed for other primes
-        raise NotImplementedError("sqrt for P % 4 != 3 not implemented.")
+        # Tonelli-Shanks with one fixed exponentiation w = n^((q-1)/2), from
+        # which r = n^((q+1)/2) and t = n^q follow; at most s further rounds
+        # of squarings fix up r. A non-residue shows up as t having order 2^s.
+        n = self.value
+        if n == 0:
+            return FieldElement(0)
+        w = _powmod(n, _TS_Q_MINUS_1_OVER_2, _P)
+        r = n * w % _P
+        t = r * w % _P
+        c = _TS_C
+        m = _TS_S
+        while t != 1:
+            i = 1
+            t2 = t * t % _P
+            while t2 != 1:
+                t2 = t2 * t2 % _P
+                i += 1
+                if i == m:
+                    raise ValueError("Value is not a quadratic residue.")
+            b = c
+            for _ in range(m - i - 1):
+                b = b * b % _P
+            m = i
+            c = b * b % _P
+            t = t * c % _P
+            r = r * b % _P
+        return FieldElement(int(r))
+
+def _batch_invert_raw(values):
+    # Montgomery's trick: one inversion plus 3(n - 1) multiplications
+    prefix = []
+    acc = 1
+    for value in values:
+        prefix.append(acc)
+        acc = acc * value % _P
+    if acc == 0:
+        raise ZeroDivisionError("Zero has no multiplicative inverse.")
+    inv = _invert(acc, _P)
+    result = [0] * len(values)
+    for i in range(len(values) - 1, -1, -1):
+        result[i] = prefix[i] * inv % _P
+        inv = inv * values[i] % _P
+    return result
+
+def batch_inverse(elements):
+    for element in elements:
+        if not isinstance(element, FieldElement):
+            raise TypeError("batch_inverse expects FieldElement instances.")
+    return [FieldElement(int(inv)) for inv in _batch_invert_raw([e.value for e in elements])]
+
+ZERO = FieldElement(0)
+ONE = FieldElement(1)
 
 # Curve parameters (from curve420_canonical.json)
 A_EDWARDS = FieldElement(763975519699500577645754547835125169481986463482154078046572648671788968290548038674290307302429817161505744408446033521089604)
 D_EDWARDS = FieldElement(763975519699500577645754547835125169481986463482154078046572648671788968290548038674290307302429817161505744408446033521089600)
 
+# Montgomery form v^2 = u^3 + A*u^2 + u, mapped from Edwards by
+# u = (1 + y) / (1 - y), v = u / x (a = A + 2, d = A - 2)
+A_MONTGOMERY = FieldElement(763975519699500577645754547835125169481986463482154078046572648671788968290548038674290307302429817161505744408446033521089602)
+U_BASE = FieldElement(1887066872174968132246224128199266266323489104588603923691363826518154582291788366769852665419756146257203683605002692187211605)
+
 # Base point G (Edwards)
 G_X = FieldElement(2554519045303036994902077297242990796196199161457630080356703041833906288977089421513471756737913123939108844302244613830350009)
 G_Y = FieldElement(1554004282195909523747673681974014268960308454695342458183393593582942692590987497223833263666951454840260505456918987028153736)
@@ -83,72 +198,361 @@ L_ORDER = 3384606560206072826633806377127787723921431976777119842737401835015085
 # Cofactor H
 H_COFACTOR = 8
 
+# Window width for w-NAF scalar multiplication
+WNAF_WIDTH = 5
+
+def _wnaf(scalar, w):
+    # Width-w NAF digits of scalar, least significant first. Every non-zero
+    # digit is odd and lies in (-2^(w-1), 2^(w-1)).
+    digits = []
+    full = 1 << w
+    half = 1 << (w - 1)
+    while scalar > 0:
+        if scalar & 1:
+            digit = scalar & (full - 1)
+            if digit >= half:
+                digit -= full
+            scalar -= digit
+        else:
+            digit = 0
+        digits.append(digit)
+        scalar >>= 1
+    return digits
+
+# Point arithmetic works on raw backend ints mod P; FieldElement is only used
+# at the API boundary of EdwardsPoint.
+_A = _mpz(A_EDWARDS.value)
+_D = _mpz(D_EDWARDS.value)
+
+def _add_raw(X1, Y1, Z1, T1, X2, Y2, Z2, T2):
+    # add-2008-hwcd: unified, so it also doubles and handles the identity
+    a = X1 * X2 % _P
+    b = Y1 * Y2 % _P
+    c = T1 * _D % _P * T2 % _P
+    d = Z1 * Z2 % _P
+    e = ((X1 + Y1) * (X2 + Y2) - a - b) % _P
+    f = d - c
+    g = d + c
+    h = b - _A * a
+    return e * f % _P, g * h % _P, f * g % _P, e * h % _P
+
+def _cached_raw(x, y):
+    # Operand form for an affine point that is added many times (table
+    # entries): x + y and d*x*y are computed once instead of in every addition
+    return x, y, (x + y) % _P, _D * x % _P * y % _P
+
+def _madd_cached_raw(X1, Y1, Z1, T1, x2, y2, s2, dt2):
+    # _add_raw for an affine operand (Z2 = 1) in _cached_raw form: x2 + y2
+    # and d*T2 come precomputed, and Z1 * Z2 is just Z1
+    a = X1 * x2 % _P
+    b = Y1 * y2 % _P
+    c = T1 * dt2 % _P
+    e = ((X1 + Y1) * s2 - a - b) % _P
+    f = Z1 - c
+    g = Z1 + c
+    h = b - _A * a
+    return e * f % _P, g * h % _P, f * g % _P, e * h % _P
+
+def _double_raw(X1, Y1, Z1):
+    # dbl-2008-hwcd
+    a = X1 * X1 % _P
+    b = Y1 * Y1 % _P
+    c = 2 * Z1 * Z1
+    d = _A * a % _P
+    s = X1 + Y1
+    e = (s * s - a - b) % _P
+    g = d + b
+    f = (g - c) % _P
+    h = d - b
+    return e * f % _P, g * h % _P, f * g % _P, e * h % _P
+
+def _wnaf_mul_raw(table, digits):
+    # Runs the whole w-NAF loop on raw coordinate tuples so no EdwardsPoint
+    # is allocated per step; table holds the affine odd multiples P, 3P, 5P,
+    # ... as (x, y, x + y, d*x*y) rows for _madd_cached_raw
+    X, Y, Z, T = 0, 1, 1, 0
+    for digit in reversed(digits):
+        X, Y, Z, T = _double_raw(X, Y, Z)
+        if digit > 0:
+            x2, y2, s2, dt2 = table[digit >> 1]
+            X, Y, Z, T = _madd_cached_raw(X, Y, Z, T, x2, y2, s2, dt2)
+        elif digit < 0:
+            x2, y2, s2, dt2 = table[-digit >> 1]
+            X, Y, Z, T = _madd_cached_raw(X, Y, Z, T, -x2, y2, y2 - x2, -dt2)
+    return X, Y, Z, T
+
+# x-only Montgomery ladder. Every scalar below 2^_LADDER_BITS runs the same
+# sequence of field operations; the bits only steer the masked swaps.
+_A24 = _mpz((A_MONTGOMERY.value + 2) * pow(4, -1, P) % P)
+_LADDER_BITS = (H_COFACTOR * L_ORDER).bit_length()
+
+def _cswap(bit, a, b):
+    # Swaps a and b when bit is 1, using a mask instead of a branch
+    dummy = -bit & (a ^ b)
+    return a ^ dummy, b ^ dummy
+
+def _xdbl(X, Z):
+    s = X + Z
+    t = X - Z
+    t1 = s * s % _P
+    t2 = t * t % _P
+    t3 = t1 - t2
+    return t1 * t2 % _P, t3 * (t2 + _A24 * t3) % _P
+
+def _xadd(X2, Z2, X3, Z3, u):
+    # (X2:Z2) + (X3:Z3) given that their difference has affine coordinate u
+    t1 = (X2 - Z2) * (X3 + Z3) % _P
+    t2 = (X2 + Z2) * (X3 - Z3) % _P
+    s = t1 + t2
+    t = t1 - t2
+    return s * s % _P, u * (t * t % _P) % _P
+
+def _ladder_raw(u, scalar, nbits):
+    # Returns (X0:Z0) = [scalar]P for P with coordinate u, scanning exactly
+    # nbits bits of scalar
+    X0, Z0 = 1, 0
+    X1, Z1 = u, 1
+    swap = 0
+    for i in range(nbits - 1, -1, -1):
+        bit = (scalar >> i) & 1
+        swap ^= bit
+        X0, X1 = _cswap(swap, X0, X1)
+        Z0, Z1 = _cswap(swap, Z0, Z1)
+        swap = bit
+        X1, Z1 = _xadd(X0, Z0, X1, Z1, u)
+        X0, Z0 = _xdbl(X0, Z0)
+    X0, X1 = _cswap(swap, X0, X1)
+    Z0, Z1 = _cswap(swap, Z0, Z1)
+    return X0, Z0
+
+def montgomery_ladder(u, scalar):
+    # u-coordinate of [scalar]P, where P has Montgomery coordinate u. As in
+    # X25519, the point at infinity comes out as 0.
+    if not isinstance(u, FieldElement):
+        raise TypeError("u must be a FieldElement instance.")
+    if not isinstance(scalar, int) or scalar < 0:
+        raise ValueError("Scalar must be a non-negative integer.")
+    nbits = max(_LADDER_BITS, scalar.bit_length())
+    X0, Z0 = _ladder_raw(_mpz(u.value), scalar, nbits)
+    return FieldElement(0 if Z0 == 0 else int(X0 * _invert(Z0, _P) % _P))
+
+def _edwards_ladder_raw(X, Y, Z, T, scalar, nbits):
+    # [scalar]P on extended Edwards coordinates: one unified addition and one
+    # doubling per bit, with R1 - R0 = P kept invariant. The unified formulas
+    # have no exceptional cases for points of odd order, so no step branches
+    # on the scalar or on intermediate values.
+    X0, Y0, Z0, T0 = 0, 1, 1, 0
+    X1, Y1, Z1, T1 = X, Y, Z, T
+    swap = 0
+    for i in range(nbits - 1, -1, -1):
+        bit = (scalar >> i) & 1
+        swap ^= bit
+        X0, X1 = _cswap(swap, X0, X1)
+        Y0, Y1 = _cswap(swap, Y0, Y1)
+        Z0, Z1 = _cswap(swap, Z0, Z1)
+        T0, T1 = _cswap(swap, T0, T1)
+        swap = bit
+        X1, Y1, Z1, T1 = _add_raw(X0, Y0, Z0, T0, X1, Y1, Z1, T1)
+        X0, Y0, Z0, T0 = _double_raw(X0, Y0, Z0)
+    X0, X1 = _cswap(swap, X0, X1)
+    Y0, Y1 = _cswap(swap, Y0, Y1)
+    Z0, Z1 = _cswap(swap, Z0, Z1)
+    T0, T1 = _cswap(swap, T0, T1)
+    return X0, Y0, Z0, T0
+
+def _normalize_points(points):
+    # Rescales every point to Z = 1 with a single shared inversion
+    z_invs = _batch_invert_raw([Q._Z for Q in points])
+    normalized = []
+    for Q, z_inv in zip(points, z_invs):
+        x = Q._X * z_inv % _P
+        y = Q._Y * z_inv % _P
+        normalized.append(EdwardsPoint._from_raw(x, y, _mpz(1), x * y % _P))
+    return normalized
+
 class EdwardsPoint:
-    def __init__(self, x, y):
+    # Extended twisted Edwards coordinates (X:Y:Z:T) with x = X/Z, y = Y/Z
+    # and T = XY/Z (Hisil-Wong-Carter-Dawson, "Twisted Edwards Curves
+    # Revisited"). The affine coordinates are only recovered on demand.
+    __slots__ = ('_X', '_Y', '_Z', '_T', '_odd_multiples', '_on_curve')
+
+    def __init__(self, x, y, z=None, t=None):
         if not isinstance(x, FieldElement) or not isinstance(y, FieldElement):
             raise TypeError("EdwardsPoint coordinates must be FieldElement instances.")
-        self.x = x
-        self.y = y
+        if z is None:
+            z = ONE
+            t = x * y
+        elif not isinstance(z, FieldElement) or not isinstance(t, FieldElement):
+            raise TypeError("EdwardsPoint coordinates must be FieldElement instances.")
+        self._X = _mpz(x.value)
+        self._Y = _mpz(y.value)
+        self._Z = _mpz(z.value)
+        self._T = _mpz(t.value)
+        self._odd_multiples = None
+        self._on_curve = None
+
+    @classmethod
+    def _from_raw(cls, X, Y, Z, T):
+        point = cls.__new__(cls)
+        point._X = X
+        point._Y = Y
+        point._Z = Z
+        point._T = T
+        point._odd_multiples = None
+        point._on_curve = None
+        return point
+
+    def to_affine(self):
+        if self._Z == 1:
+            return FieldElement(int(self._X)), FieldElement(int(self._Y))
+        z_inv = _invert(self._Z, _P)
+        return FieldElement(int(self._X * z_inv % _P)), FieldElement(int(self._Y * z_inv % _P))
+
+    @property
+    def x(self):
+        return self.to_affine()[0]
+
+    @property
+    def y(self):
+        return self.to_affine()[1]
 
     def __eq__(self, other):
         if not isinstance(other, EdwardsPoint):
             return NotImplemented
-        return self.x == other.x and self.y == other.y
+        return ((self._X * other._Z - other._X * self._Z) % _P == 0
+                and (self._Y * other._Z - other._Y * self._Z) % _P == 0)
+
+    def __neg__(self):
+        return EdwardsPoint._from_raw(-self._X % _P, self._Y, self._Z, -self._T % _P)
 
     def __repr__(self):
-        return f"EdwardsPoint(x={self.x.value}, y={self.y.value})"
+        x, y = self.to_affine()
+        return f"EdwardsPoint(x={x.value}, y={y.value})"
 
     def is_on_curve(self):
-        lhs = A_EDWARDS * self.x**2 + self.y**2
-        rhs = FieldElement(1) + D_EDWARDS * self.x**2 * self.y**2
-        return lhs == rhs
+        # Points are immutable, so the check is done at most once per instance
+        if self._on_curve is None:
+            self._on_curve = self._check_on_curve()
+        return self._on_curve
+
+    def _check_on_curve(self):
+        # (aX^2 + Y^2)Z^2 = Z^4 + dX^2Y^2 and XY = ZT
+        X, Y, Z, T = self._X, self._Y, self._Z, self._T
+        if Z == 0:
+            return False
+        xx = X * X % _P
+        yy = Y * Y % _P
+        zz = Z * Z % _P
+        lhs = (_A * xx + yy) * zz
+        rhs = zz * zz + _D * xx % _P * yy
+        return (lhs - rhs) % _P == 0 and (X * Y - Z * T) % _P == 0
 
     def __add__(self, other):
         if not isinstance(other, EdwardsPoint):
             raise TypeError("Can only add EdwardsPoint to another EdwardsPoint.")
-
-        # Identity element (0, 1)
-        if self.x == 0 and self.y == 1:
-            return other
-        if other.x == 0 and other.y == 1:
-            return self
-
-        x1, y1 = self.x, self.y
-        x2, y2 = other.x, other.y
-
-        x3_num = x1 * y2 + y1 * x2
-        x3_den = FieldElement(1) + D_EDWARDS * x1 * x2 * y1 * y2
-
-        y3_num = y1 * y2 - A_EDWARDS * x1 * x2
-        y3_den = FieldElement(1) - D_EDWARDS * x1 * x2 * y1 * y2
-
-        if x3_den == 0 or y3_den == 0:
-            # This would indicate point at infinity or other special cases
-            # For Edwards curves, (0,1) is the identity.
-            # If a denominator is zero, it implies a special case like adding a point to its negative
-            # or adding the identity.
-            # For now, we'll return the identity if denominators are zero, assuming valid inputs.
-            return EdwardsPoint(FieldElement(0), FieldElement(1))
-
-        x3 = x3_num / x3_den
-        y3 = y3_num / y3_den
-        return EdwardsPoint(x3, y3)
+        return EdwardsPoint._from_raw(*_add_raw(self._X, self._Y, self._Z, self._T,
+                                                other._X, other._Y, other._Z, other._T))
+
+    def double(self):
+        return EdwardsPoint._from_raw(*_double_raw(self._X, self._Y, self._Z))
+
+    def _precompute_odd_multiples(self, w):
+        # [P, 3P, 5P, ..., (2^(w-1) - 1)P] normalized to Z = 1 and cached per
+        # window width as (x, y, x + y, d*x*y) rows for _wnaf_mul_raw
+        if self._odd_multiples is None:
+            self._odd_multiples = {}
+        table = self._odd_multiples.get(w)
+        if table is None:
+            double = self.double()
+            table = [self]
+            for _ in range((1 << (w - 2)) - 1):
+                table.append(table[-1] + double)
+            table = [_cached_raw(Q._X, Q._Y) for Q in _normalize_points(table)]
+            self._odd_multiples[w] = table
+        return table
 
     def __mul__(self, scalar):
         if not isinstance(scalar, int) or scalar < 0:
             raise ValueError("Scalar must be a non-negative integer.")
 
-        result = EdwardsPoint(FieldElement(0), FieldElement(1)) # Identity element
-        addend = self
+        # G * scalar goes through the comb (scalar_mul_base), which reads its
+        # table with a secret-dependent index and is NOT constant-time. For
+        # secret scalars (e.g. key generation) multiply a copy of the base
+        # point instead, EdwardsPoint(G_X, G_Y) * scalar, to get the ladder.
+        if self is G:
+            return scalar_mul_base(scalar)
+
+        # Fixed-length ladder: every scalar below 2^_LADDER_BITS runs the
+        # same sequence of additions, doublings and masked swaps
+        scalar %= H_COFACTOR * L_ORDER
+        return EdwardsPoint._from_raw(*_edwards_ladder_raw(self._X, self._Y, self._Z, self._T,
+                                                           scalar, _LADDER_BITS))
+
+    def mul_vartime(self, scalar):
+        # w-NAF multiplication. Its running time depends on the scalar, so only
+        # use it with public scalars (e.g. signature verification).
+        if not isinstance(scalar, int) or scalar < 0:
+            raise ValueError("Scalar must be a non-negative integer.")
+
+        if scalar == 0:
+            return IDENTITY
 
-        while scalar > 0:
-            if scalar & 1: # If scalar is odd
-                result += addend
-            addend += addend # Double the addend
-            scalar >>= 1 # Divide scalar by 2
+        table = self._precompute_odd_multiples(WNAF_WIDTH)
+        return EdwardsPoint._from_raw(*_wnaf_mul_raw(table, _wnaf(scalar, WNAF_WIDTH)))
 
-        return result
+# Identity element (0, 1)
+IDENTITY = EdwardsPoint(ZERO, ONE)
 
 # Canonical Base Point
 G = EdwardsPoint(G_X, G_Y)
 
+# Fixed-base comb for G: COMB_W teeth spaced COMB_D bits apart cover 424 bits,
+# enough for any scalar reduced mod L_ORDER.
+COMB_W = 8
+COMB_D = 53
+
+def _build_comb_table(base):
+    # Entry i = sum of 2^(j*COMB_D) * base over the set bits j of i. Entries
+    # are affine (Z = 1) and kept in _cached_raw form, column by column:
+    # (x[], y[], (x + y)[], (d*x*y)[]).
+    table = [IDENTITY]
+    tooth = base
+    for j in range(COMB_W):
+        table.extend([entry + tooth for entry in table])
+        if j < COMB_W - 1:
+            for _ in range(COMB_D):
+                tooth = tooth.double()
+    rows = [_cached_raw(Q._X, Q._Y) for Q in _normalize_points(table)]
+    return tuple(zip(*rows))
+
+G_COMB_TABLE = _build_comb_table(G)
+
+def scalar_mul_base(scalar):
+    if not isinstance(scalar, int) or scalar < 0:
+        raise ValueError("Scalar must be a non-negative integer.")
+    scalar %= L_ORDER
+
+    # Fixed number of doublings and additions, but each table entry is picked
+    # by a secret-dependent index, so this is not constant-time with respect
+    # to memory access patterns
+    xs, ys, sums, dts = G_COMB_TABLE
+    X, Y, Z, T = 0, 1, 1, 0 # Identity element
+    for i in range(COMB_D - 1, -1, -1):
+        X, Y, Z, T = _double_raw(X, Y, Z)
+        index = 0
+        for j in range(COMB_W):
+            index |= ((scalar >> (j * COMB_D + i)) & 1) << j
+        X, Y, Z, T = _madd_cached_raw(X, Y, Z, T, xs[index], ys[index], sums[index], dts[index])
+    return EdwardsPoint._from_raw(X, Y, Z, T)
+
+def batch_scalar_mul(points, scalars):
+    # [k_i]P_i for many independent (point, scalar) pairs, each computed by
+    # EdwardsPoint.__mul__ (the comb for G, the ladder otherwise). The results
+    # share a single batch inversion and come back normalized to Z = 1, so
+    # to_affine() and encoding cost no further inversions.
+    if len(points) != len(scalars):
+        raise ValueError("points and scalars must have the same length.")
+    for point in points:
+        if not isinstance(point, EdwardsPoint):
+            raise TypeError("batch_scalar_mul expects EdwardsPoint instances.")
+    return _normalize_points([point * scalar for point, scalar in zip(points, scalars)])
@@ -2,7 +2,7 @@
 # python_ed420/tests/test_curve.py
 
 import pytest
-from curve import FieldElement, EdwardsPoint, P, A_EDWARDS, D_EDWARDS, G, L_ORDER, H_COFACTOR
+from curve import FieldElement, EdwardsPoint, P, A_EDWARDS, D_EDWARDS, G, L_ORDER, H_COFACTOR, U_BASE, batch_inverse, batch_scalar_mul, scalar_mul_base, montgomery_ladder, COMB_D, COMB_W
 
 # Test FieldElement
 def test_field_element_arithmetic():
@@ -12,6 +12,8 @@ def test_field_element_arithmetic():
     assert (fe1 + fe2).value == 15 % P
     assert (fe1 - fe2).value == 5 % P
     assert (fe1 * fe2).value == 50 % P
+    assert fe1.square() == fe1 * fe1
+    assert FieldElement(P - 1).square() == 1
     assert (fe1 / fe2).value == (10 * pow(5, P - 2, P)) % P
     assert (-fe1).value == (P - 10) % P
     assert fe1 == 10
@@ -20,6 +22,9 @@ def test_field_element_arithmetic():
 def test_field_element_inverse():
     fe = FieldElement(7)
     assert (fe * fe.inverse()).value == 1
+    assert fe.inverse() == pow(7, P - 2, P)
+    with pytest.raises(ZeroDivisionError):
+        FieldElement(0).inverse()
 
 def test_field_element_is_square_and_sqrt():
     # Test a known quadratic residue
@@ -37,20 +42,45 @@ def test_field_element_is_square_and_sqrt():
         with pytest.raises(ValueError):
             non_qr.sqrt()
 
+    # P = 1 (mod 8): -1 is a square and 3 is the smallest non-residue
+    minus_one = FieldElement(P - 1)
+    assert minus_one.is_square()
+    assert minus_one.sqrt().square() == minus_one
+    non_qr = FieldElement(3)
+    assert not non_qr.is_square()
+    with pytest.raises(ValueError):
+        non_qr.sqrt()
+
+    x = FieldElement(0xdeadbeef)
+    assert x.square().sqrt() in (x, -x)
+
 # Test EdwardsPoint
 def test_edwards_point_on_curve():
     # Test the canonical base point
     assert G.is_on_curve()
+    assert G._on_curve is True
 
     # Test a point not on the curve (by changing x slightly)
     invalid_x = FieldElement(G.x.value + 1)
     invalid_point = EdwardsPoint(invalid_x, G.y)
+    assert invalid_point._on_curve is None
+    assert not invalid_point.is_on_curve()
+    assert invalid_point._on_curve is False
     assert not invalid_point.is_on_curve()
 
 def test_edwards_point_addition():
     # Test G + G (doubling)
     G_doubled = G + G
     assert G_doubled.is_on_curve()
+    assert G_doubled == G.double()
+
+    # Compare against the affine addition law after normalization
+    x, y = G.x, G.y
+    xx, yy = x.square(), y.square()
+    x3 = (x * y + y * x) / (FieldElement(1) + D_EDWARDS * xx * yy)
+    y3 = (yy - A_EDWARDS * xx) / (FieldElement(1) - D_EDWARDS * xx * yy)
+    assert G_doubled.to_affine() == (x3, y3)
+    assert G.double().to_affine() == (x3, y3)
 
     # Test G + Identity
     identity = EdwardsPoint(FieldElement(0), FieldElement(1))
@@ -76,3 +106,87 @@ def test_edwards_point_scalar_multiplication():
     h_times_g = G * H_COFACTOR
     assert h_times_g != identity
 
+
+def _double_and_add(point, scalar):
+    result = EdwardsPoint(FieldElement(0), FieldElement(1))
+    while scalar > 0:
+        if scalar & 1:
+            result += point
+        point += point
+        scalar >>= 1
+    return result
+
+def test_edwards_point_wnaf_matches_double_and_add():
+    for scalar in [1, 3, 15, 16, 31, 0xdeadbeef, (1 << 64) + 17]:
+        assert G.mul_vartime(scalar) == _double_and_add(G, scalar)
+
+def test_edwards_point_ladder_matches_wnaf():
+    Q = G.double()
+    identity = EdwardsPoint(FieldElement(0), FieldElement(1))
+    for scalar in [1, 2, 3, 0xdeadbeef, L_ORDER - 1, L_ORDER + 1, H_COFACTOR * L_ORDER + 3]:
+        assert Q * scalar == Q.mul_vartime(scalar)
+    assert Q * 0 == identity
+    assert Q * L_ORDER == identity
+    assert Q * (L_ORDER - 1) == -Q
+
+    # The point of order 2 has no affine Montgomery image
+    order_two = EdwardsPoint(FieldElement(0), FieldElement(P - 1))
+    assert order_two * 3 == order_two
+    assert order_two * 4 == identity
+
+def test_montgomery_ladder():
+    def to_u(point):
+        x, y = point.to_affine()
+        return (FieldElement(1) + y) / (FieldElement(1) - y)
+
+    assert to_u(G) == U_BASE
+    assert montgomery_ladder(U_BASE, 0xdeadbeef) == to_u(G * 0xdeadbeef)
+    assert montgomery_ladder(U_BASE, L_ORDER) == 0
+
+def test_scalar_mul_base_matches_generic():
+    for scalar in [1, 2, 0xdeadbeef, L_ORDER - 1, L_ORDER + 5]:
+        assert scalar_mul_base(scalar) == EdwardsPoint(G.x, G.y) * scalar
+
+def test_field_element_reduction_edge_cases():
+    top = FieldElement(P - 1)
+    assert (top * top).value == pow(P - 1, 2, P)
+    assert (top + top).value == P - 2
+    assert (FieldElement(0) - top).value == 1
+    for value in [P - 335, P - 1, (1 << 420) - 1, 335]:
+        assert (FieldElement(value) * FieldElement(value)).value == value * value % P
+
+def test_batch_inverse():
+    elements = [FieldElement(v) for v in [1, 2, 7, P - 1, 0xdeadbeef]]
+    assert batch_inverse(elements) == [e.inverse() for e in elements]
+    assert batch_inverse([]) == []
+    with pytest.raises(ZeroDivisionError):
+        batch_inverse([FieldElement(3), FieldElement(0)])
+
+def test_batch_scalar_mul():
+    Q = G.double()
+    points = [G, Q, Q, G]
+    scalars = [0, 1, 0xdeadbeef, L_ORDER - 1]
+    results = batch_scalar_mul(points, scalars)
+    assert results == [point * scalar for point, scalar in zip(points, scalars)]
+    assert results[2].to_affine() == (Q * 0xdeadbeef).to_affine()
+    assert results[3] == -G
+    assert batch_scalar_mul([], []) == []
+    with pytest.raises(ValueError):
+        batch_scalar_mul([G], [])
+
+def test_comb_table_entries():
+    # Each tooth 2^(j*COMB_D) * G, and a sum of two teeth, selects a single
+    # table entry per comb column
+    generic_g = EdwardsPoint(G.x, G.y)
+    for j in range(COMB_W):
+        scalar = 1 << (j * COMB_D)
+        assert scalar_mul_base(scalar) == generic_g * scalar
+    scalar = 1 + (1 << COMB_D)
+    assert scalar_mul_base(scalar) == generic_g * scalar
+
+def test_to_affine_of_z_zero_raises_zero_division():
+    # Z = 0 can only come from exceptional cofactor inputs; both bignum
+    # backends must report it the same way
+    point = EdwardsPoint(FieldElement(1), FieldElement(1), FieldElement(0), FieldElement(1))
+    with pytest.raises(ZeroDivisionError):
+        point.to_affine()